@@ -1,22 +1,27 @@
 from fastapi import FastAPI, UploadFile, Form, HTTPException, File
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-import PyPDF2
-import io
-from typing import List, Dict
+from fastapi.responses import JSONResponse, ORJSONResponse
+from starlette.formparsers import MultiPartParser
+import fitz
+import asyncio
+from typing import BinaryIO, List, Dict, FrozenSet, Optional
+from collections import OrderedDict
+import hashlib
 import re
-from docx import Document
+import zipfile
+from xml.etree import ElementTree
 import spacy
-from collections import Counter
+from spacy.language import Language
+from spacy.matcher import PhraseMatcher
+from spacy.symbols import NOUN, PROPN
 import logging
 import os
-import sys
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Resume Reviewer API")
+app = FastAPI(title="Resume Reviewer API", default_response_class=ORJSONResponse)
 
 # Configure CORS
 app.add_middleware(
@@ -27,6 +32,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Largest resume upload /analyze will parse. Checked after Starlette has read the
+# whole request, so it protects the parsers, not the upload itself.
+MAX_UPLOAD_SIZE = 10 * 1024 * 1024
+
+# Keep accepted uploads in memory instead of spooling them to a temp file on disk
+MultiPartParser.max_file_size = MAX_UPLOAD_SIZE
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     return JSONResponse(
@@ -34,84 +46,82 @@ async def global_exception_handler(request, exc):
         content={"detail": str(exc)},
     )
 
-# Load spaCy model
+# Pipeline components extract_keywords never reads. Sentence boundaries come
+# from the tokenizer-only pipeline below, so only POS tags are needed here; the
+# attribute_ruler stays because it maps the tagger's tags onto token.pos_.
+# Excluded (rather than disabled) components are never loaded into memory.
+EXCLUDED_PIPES = ["parser", "ner", "lemmatizer"]
+
+# Load spaCy model. It is installed at build time from the wheel pinned in
+# requirements.txt, so a missing model fails startup instead of downloading.
 try:
-    nlp = spacy.load("en_core_web_sm")
+    nlp = spacy.load("en_core_web_sm", exclude=EXCLUDED_PIPES)
     logger.info("Successfully loaded spaCy model")
-except Exception as e:
-    logger.warning(f"Error loading spaCy model: {str(e)}")
-    logger.info("Downloading spaCy model...")
-    try:
-        import subprocess
-        subprocess.run([sys.executable, "-m", "spacy", "download", "en_core_web_sm"], check=True)
-        nlp = spacy.load("en_core_web_sm")
-        logger.info("Successfully downloaded and loaded spaCy model")
-    except Exception as download_error:
-        logger.error(f"Error downloading spaCy model: {str(download_error)}")
-        raise
-
-def extract_text_from_pdf(content: bytes) -> str:
+except OSError as e:
+    logger.error(f"spaCy model en_core_web_sm is not installed: {str(e)}")
+    raise
+
+# Cap the text spaCy will parse; no real resume or job description comes close
+nlp.max_length = 200_000
+
+# Tokenizer-only pipeline for phrase matching. Keyword lookups don't need the
+# tagger or parser; the sentencizer supplies the sentence boundaries that
+# education matches are paired by.
+blank_nlp = spacy.blank("en")
+blank_nlp.add_pipe("sentencizer")
+blank_nlp.max_length = nlp.max_length
+
+def extract_text_from_pdf(file: BinaryIO) -> str:
     """Extract text from PDF file."""
     try:
-        pdf_reader = PyPDF2.PdfReader(io.BytesIO(content))
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text()
+        # MuPDF parses from a contiguous buffer, so the upload is read in full here
+        with fitz.open(stream=file.read(), filetype="pdf") as pdf:
+            text = "\n".join(page.get_text("text") for page in pdf)
         logger.debug(f"Successfully extracted text from PDF, length: {len(text)} characters")
         return text
     except Exception as e:
         logger.error(f"Error processing PDF: {str(e)}")
         raise HTTPException(status_code=400, detail=f"Error processing PDF: {str(e)}")
 
-def extract_text_from_docx(content: bytes) -> str:
+# WordprocessingML namespace of the elements in word/document.xml
+W_NAMESPACE = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+# Run children rendered as text, the same way python-docx's Paragraph.text does
+DOCX_RUN_TEXT = {
+    f"{W_NAMESPACE}tab": "\t",
+    f"{W_NAMESPACE}br": "\n",
+    f"{W_NAMESPACE}cr": "\n",
+}
+
+def docx_paragraph_text(paragraph: ElementTree.Element) -> str:
+    """Join the text, tabs and line breaks of a w:p element's runs."""
+    # Only direct children of w:r count; w:tab also appears in w:pPr as a tab stop definition
+    return "".join(
+        node.text or "" if node.tag == f"{W_NAMESPACE}t" else DOCX_RUN_TEXT.get(node.tag, "")
+        for run in paragraph.iter(f"{W_NAMESPACE}r")
+        for node in run
+    )
+
+def extract_text_from_docx(file: BinaryIO) -> str:
     """Extract text from DOCX file."""
     try:
-        doc = Document(io.BytesIO(content))
-        text = " ".join([paragraph.text for paragraph in doc.paragraphs])
+        # Read the body paragraphs straight from word/document.xml rather than
+        # building python-docx's object model for the whole document
+        with zipfile.ZipFile(file) as archive:
+            body = ElementTree.fromstring(archive.read("word/document.xml")).find(f"{W_NAMESPACE}body")
+        paragraphs = (docx_paragraph_text(paragraph) for paragraph in body.iterfind(f"{W_NAMESPACE}p"))
+        text = " ".join(paragraph for paragraph in paragraphs if paragraph)
         logger.debug(f"Successfully extracted text from DOCX, length: {len(text)} characters")
         return text
     except Exception as e:
         logger.error(f"Error processing DOCX: {str(e)}")
         raise HTTPException(status_code=400, detail=f"Error processing DOCX: {str(e)}")
 
-def generate_case_variations(base_terms):
-    """Generate all possible case variations for a list of terms."""
-    variations = set()
-    for term in base_terms:
-        # Original term
-        variations.add(term)
-        # Uppercase
-        variations.add(term.upper())
-        # Lowercase
-        variations.add(term.lower())
-        # Title case
-        variations.add(term.title())
-        
-        # Handle dot variations
-        if '.' in term:
-            # Remove all dots
-            no_dots = term.replace('.', '')
-            variations.add(no_dots)
-            variations.add(no_dots.upper())
-            variations.add(no_dots.lower())
-            variations.add(no_dots.title())
-            
-            # Add space after dots
-            spaced_dots = term.replace('.', '. ')
-            variations.add(spaced_dots)
-            variations.add(spaced_dots.upper())
-            variations.add(spaced_dots.lower())
-            variations.add(spaced_dots.title())
-            
-            # Add space between letters
-            if len(term) <= 5:  # Only for short abbreviations
-                spaced = ' '.join(term.replace('.', ''))
-                variations.add(spaced)
-                variations.add(spaced.upper())
-                variations.add(spaced.lower())
-                variations.add(spaced.title())
-    
-    return list(variations)
+# Text extractors by lowercase file extension
+TEXT_EXTRACTORS = {
+    '.pdf': extract_text_from_pdf,
+    '.docx': extract_text_from_docx,
+}
 
 # Base terms for degrees
 BASE_TERMS = {
@@ -132,228 +142,261 @@ BASE_TERMS = {
     'phd': ['phd', 'ph.d', 'ph d'],
 }
 
-# Generate all variations
-DEGREE_VARIATIONS = {}
-for degree, base_terms in BASE_TERMS.items():
-    DEGREE_VARIATIONS[degree] = generate_case_variations(base_terms)
-
 # Define education degree mappings and patterns with all variations
 EDUCATION_PATTERNS = {
     'degrees': {
         # Bachelor's degrees with all variations
         'bachelor': [
-            'bachelor', 'bachelors', 'bachelor\'s', 'Bachelor', 'Bachelors', 'BACHELOR', 'BACHELORS',
-            *DEGREE_VARIATIONS['bca'],    # BCA variations
-            *DEGREE_VARIATIONS['btech'],  # BTech variations
-            *DEGREE_VARIATIONS['be'],     # BE variations
-            *DEGREE_VARIATIONS['bsc'],    # BSc variations
-            *DEGREE_VARIATIONS['bcom'],   # BCom variations
-            *DEGREE_VARIATIONS['bba'],    # BBA variations
-            *DEGREE_VARIATIONS['ba'],     # BA variations
-            'undergraduate', 'Undergraduate', 'UNDERGRADUATE',
-            'ug', 'UG', 'u.g', 'U.G', 'u.g.', 'U.G.'
+            'bachelor', 'bachelors', 'bachelor\'s',
+            *BASE_TERMS['bca'],    # BCA variations
+            *BASE_TERMS['btech'],  # BTech variations
+            *BASE_TERMS['be'],     # BE variations
+            *BASE_TERMS['bsc'],    # BSc variations
+            *BASE_TERMS['bcom'],   # BCom variations
+            *BASE_TERMS['bba'],    # BBA variations
+            *BASE_TERMS['ba'],     # BA variations
+            'undergraduate', 'ug', 'u.g', 'u.g.'
         ],
         # Master's degrees with all variations
         'master': [
-            'master', 'masters', 'master\'s', 'Master', 'Masters', 'MASTER', 'MASTERS',
-            *DEGREE_VARIATIONS['mca'],    # MCA variations
-            *DEGREE_VARIATIONS['mtech'],  # MTech variations
-            *DEGREE_VARIATIONS['me'],     # ME variations
-            *DEGREE_VARIATIONS['msc'],    # MSc variations
-            *DEGREE_VARIATIONS['mcom'],   # MCom variations
-            *DEGREE_VARIATIONS['mba'],    # MBA variations
-            *DEGREE_VARIATIONS['ma'],     # MA variations
-            'postgraduate', 'Postgraduate', 'POSTGRADUATE',
-            'pg', 'PG', 'p.g', 'P.G', 'p.g.', 'P.G.'
+            'master', 'masters', 'master\'s',
+            *BASE_TERMS['mca'],    # MCA variations
+            *BASE_TERMS['mtech'],  # MTech variations
+            *BASE_TERMS['me'],     # ME variations
+            *BASE_TERMS['msc'],    # MSc variations
+            *BASE_TERMS['mcom'],   # MCom variations
+            *BASE_TERMS['mba'],    # MBA variations
+            *BASE_TERMS['ma'],     # MA variations
+            'postgraduate', 'pg', 'p.g', 'p.g.'
         ],
         # Doctorate degrees with all variations
         'doctorate': [
-            *DEGREE_VARIATIONS['phd'],
-            'doctorate', 'Doctorate', 'DOCTORATE',
-            'doctor of philosophy', 'Doctor of Philosophy', 'DOCTOR OF PHILOSOPHY'
+            *BASE_TERMS['phd'],
+            'doctorate', 'doctor of philosophy'
         ]
     },
     'fields': {
         # Technology and Engineering fields with variations
         'technology': [
-            'computer science', 'Computer Science', 'COMPUTER SCIENCE',
-            'cs', 'CS', 'c.s', 'C.S', 'c.s.', 'C.S.',
-            'cse', 'CSE', 'c.s.e', 'C.S.E', 'c.s.e.', 'C.S.E.',
-            'information technology', 'Information Technology', 'INFORMATION TECHNOLOGY',
-            'it', 'IT', 'i.t', 'I.T', 'i.t.', 'I.T.',
-            'software engineering', 'Software Engineering', 'SOFTWARE ENGINEERING',
-            'se', 'SE', 's.e', 'S.E', 's.e.', 'S.E.',
-            'computer engineering', 'Computer Engineering', 'COMPUTER ENGINEERING',
-            'ce', 'CE', 'c.e', 'C.E', 'c.e.', 'C.E.',
-            'electronics', 'Electronics', 'ELECTRONICS',
-            'ec', 'EC', 'e.c', 'E.C', 'e.c.', 'E.C.',
-            'electrical', 'Electrical', 'ELECTRICAL',
-            'ee', 'EE', 'e.e', 'E.E', 'e.e.', 'E.E.',
-            'mechanical', 'Mechanical', 'MECHANICAL',
-            'me', 'ME', 'm.e', 'M.E', 'm.e.', 'M.E.',
-            'civil engineering', 'Civil Engineering', 'CIVIL ENGINEERING',
-            'civil', 'Civil', 'CIVIL',
-            'data science', 'Data Science', 'DATA SCIENCE',
-            'ds', 'DS', 'd.s', 'D.S', 'd.s.', 'D.S.',
-            'artificial intelligence', 'Artificial Intelligence', 'ARTIFICIAL INTELLIGENCE',
-            'ai', 'AI', 'a.i', 'A.I', 'a.i.', 'A.I.',
-            'machine learning', 'Machine Learning', 'MACHINE LEARNING',
-            'ml', 'ML', 'm.l', 'M.L', 'm.l.', 'M.L.',
-            'robotics', 'Robotics', 'ROBOTICS',
-            'automation', 'Automation', 'AUTOMATION',
-            'information systems', 'Information Systems', 'INFORMATION SYSTEMS',
-            'is', 'IS', 'i.s', 'I.S', 'i.s.', 'I.S.',
-            'web development', 'Web Development', 'WEB DEVELOPMENT',
-            'web dev', 'Web Dev', 'WEB DEV',
-            'mobile development', 'Mobile Development', 'MOBILE DEVELOPMENT',
-            'app dev', 'App Dev', 'APP DEV',
-            'cloud computing', 'Cloud Computing', 'CLOUD COMPUTING',
-            'devops', 'DevOps', 'DEVOPS',
-            'cybersecurity', 'Cybersecurity', 'CYBERSECURITY',
-            'security', 'Security', 'SECURITY',
-            'network engineering', 'Network Engineering', 'NETWORK ENGINEERING',
-            'networking', 'Networking', 'NETWORKING'
+            'computer science', 'cs', 'c.s', 'c.s.',
+            'cse', 'c.s.e', 'c.s.e.',
+            'information technology', 'it', 'i.t', 'i.t.',
+            'software engineering', 'se', 's.e', 's.e.',
+            'computer engineering', 'ce', 'c.e', 'c.e.',
+            'electronics', 'ec', 'e.c', 'e.c.',
+            'electrical', 'ee', 'e.e', 'e.e.',
+            'mechanical', 'me', 'm.e', 'm.e.',
+            'civil engineering', 'civil',
+            'data science', 'ds', 'd.s', 'd.s.',
+            'artificial intelligence', 'ai', 'a.i', 'a.i.',
+            'machine learning', 'ml', 'm.l', 'm.l.',
+            'robotics', 'automation',
+            'information systems', 'is', 'i.s', 'i.s.',
+            'web development', 'web dev',
+            'mobile development', 'app dev',
+            'cloud computing', 'devops',
+            'cybersecurity', 'security',
+            'network engineering', 'networking'
         ]
     }
 }
 
-def clean_and_normalize_text(text: str) -> str:
-    """Clean and normalize text by removing extra spaces and normalizing dots."""
-    # Remove extra whitespace
-    text = ' '.join(text.split())
-    # Normalize dots in abbreviations (e.g., "b.tech" and "b. tech" -> "b.tech")
-    text = re.sub(r'\.\s+', '.', text)
-    return text
-
-def extract_education_info(text: str) -> List[str]:
-    """Extract education information from text with improved pattern matching."""
-    text = clean_and_normalize_text(text)
-    education_info = set()
-    
-    # Split text into sentences and process each one
-    sentences = [s.strip() for s in text.split('.') if s.strip()]
+# Phrase matcher over every degree and field variation, labelled with its type.
+# Variations are stored lowercase to match the lowercased docs; dotted
+# abbreviations also get their spaced form ("b.tech" -> "b. tech").
+EDUCATION_MATCHER = PhraseMatcher(blank_nlp.vocab, attr="LOWER")
+for group in EDUCATION_PATTERNS.values():
+    for label, variations in group.items():
+        patterns = set(variations)
+        patterns |= {p.replace('.', '. ').strip() for p in patterns if '.' in p}
+        EDUCATION_MATCHER.add(label, [blank_nlp.make_doc(p) for p in patterns])
+
+# Dotted degree abbreviations ("m.sc", "b. tech"). The tokenizer splits the
+# trailing period of "m.sc." into its own token, which the sentencizer would
+# otherwise take as a sentence end, separating the degree from its field.
+DEGREE_ABBREVIATION_MATCHER = PhraseMatcher(blank_nlp.vocab, attr="LOWER")
+for variations in EDUCATION_PATTERNS['degrees'].values():
+    abbreviations = {p.rstrip('.') for p in variations if '.' in p}
+    abbreviations |= {p.replace('.', '. ').strip() for p in abbreviations}
+    DEGREE_ABBREVIATION_MATCHER.add("degree", [blank_nlp.make_doc(p) for p in abbreviations])
+
+@Language.component("degree_abbreviation_boundaries")
+def degree_abbreviation_boundaries(doc):
+    """Keep a period attached to a degree abbreviation from starting a new sentence."""
+    for match_id, start, end in DEGREE_ABBREVIATION_MATCHER(doc):
+        if end + 1 < len(doc) and doc[end].text == '.' and not doc[end - 1].whitespace_:
+            doc[end + 1].is_sent_start = False
+    return doc
+
+blank_nlp.add_pipe("degree_abbreviation_boundaries", before="sentencizer")
+
+# Number of distinct results extract_education_info can produce: every degree
+# type on its own or paired with each field type
+EDUCATION_RESULT_LIMIT = len(EDUCATION_PATTERNS['degrees']) * (len(EDUCATION_PATTERNS['fields']) + 1)
+
+def extract_education_info(doc) -> List[str]:
+    """Extract education information from a sentence-split doc with a single phrase-matcher pass."""
+    labels_by_sentence = {}
+    for match_id, start, end in EDUCATION_MATCHER(doc):
+        sentence_start = doc[start].sent.start
+        labels_by_sentence.setdefault(sentence_start, set()).add(doc.vocab.strings[match_id])
     
-    for sentence in sentences:
-        # Try matching the original text and lowercase version
-        texts_to_check = [sentence, sentence.lower(), sentence.upper()]
-        
-        for check_text in texts_to_check:
-            # Look for degree patterns
-            for degree_type, variations in EDUCATION_PATTERNS['degrees'].items():
-                if any(variation in check_text for variation in variations):
-                    # Try to find the field of study
-                    for field_type, fields in EDUCATION_PATTERNS['fields'].items():
-                        if any(field in check_text for field in fields):
-                            education_info.add(f"{degree_type} in {field_type}")
-                            break
-                    else:
-                        # If no specific field found, just add the degree
-                        education_info.add(degree_type)
-                    break
+    education_info = set()
+    for labels in labels_by_sentence.values():
+        degree_type = next((d for d in EDUCATION_PATTERNS['degrees'] if d in labels), None)
+        if degree_type is None:
+            continue
+        # Try to find the field of study in the same sentence
+        field_type = next((f for f in EDUCATION_PATTERNS['fields'] if f in labels), None)
+        education_info.add(f"{degree_type} in {field_type}" if field_type else degree_type)
+        if len(education_info) == EDUCATION_RESULT_LIMIT:
+            break
     
     return list(education_info)
 
-def extract_keywords(text: str) -> Dict[str, List[str]]:
+# Soft skills patterns
+SOFT_SKILLS_KEYWORDS = (
+    'communication', 'leadership', 'teamwork', 'problem solving', 'analytical',
+    'time management', 'organization', 'adaptability', 'creativity', 'critical thinking',
+    'collaboration', 'interpersonal', 'presentation', 'decision making', 'flexibility',
+    'project management', 'team player', 'multitasking', 'attention to detail'
+)
+
+# Technical skills patterns
+TECHNICAL_SKILLS_KEYWORDS = (
+    'programming', 'software', 'development', 'framework', 'language', 'database',
+    'python', 'java', 'javascript', 'typescript', 'react', 'node', 'angular', 'vue',
+    'html', 'css', 'sql', 'nosql', 'mongodb', 'postgresql', 'mysql', 'oracle',
+    'aws', 'azure', 'cloud', 'docker', 'kubernetes', 'devops', 'ci/cd',
+    'git', 'github', 'bitbucket', 'jira', 'agile', 'scrum', 'rest', 'api',
+    'microservices', 'web services', 'testing', 'debugging', 'algorithms',
+    'data structures', 'oop', 'object oriented', 'functional programming',
+    'mobile', 'android', 'ios', 'swift', 'kotlin', 'flutter', 'react native'
+)
+
+# Experience patterns
+EXPERIENCE_KEYWORDS = ('experience', 'work', 'project', 'year')
+
+# Single alternations so each token costs one regex search instead of a Python
+# loop over every keyword; like the loops they replace, they match substrings
+TECHNICAL_SKILLS_RE = re.compile("|".join(map(re.escape, TECHNICAL_SKILLS_KEYWORDS)))
+EXPERIENCE_RE = re.compile("|".join(map(re.escape, EXPERIENCE_KEYWORDS)))
+
+def extract_keywords_batch(texts: List[str]) -> List[Dict[str, FrozenSet[str]]]:
+    """Extract important keywords from several texts, batching them through spaCy."""
+    for text in texts:
+        if len(text) > nlp.max_length:
+            logger.warning(f"Truncating text from {len(text)} to {nlp.max_length} characters before parsing")
+    texts = [text[:nlp.max_length] for text in texts]
+    # The tagger reads the original casing. The match docs are lowercased because the
+    # tokenizer splits dotted abbreviations differently by case ("Ph.D" vs "ph.d").
+    # Truncate again after lowercasing, which can lengthen text ("İ" -> "i̇").
+    match_docs = list(blank_nlp.pipe(text.lower()[:blank_nlp.max_length] for text in texts))
+    # POS tags only gate the technical and experience checks. Texts where neither
+    # pattern occurs skip the tagger: the untagged match doc has no nouns, so the
+    # token loop finds nothing either way.
+    needs_tags = [
+        bool(TECHNICAL_SKILLS_RE.search(match_doc.text) or EXPERIENCE_RE.search(match_doc.text))
+        for match_doc in match_docs
+    ]
+    tagged_docs = nlp.pipe(text for text, tag in zip(texts, needs_tags) if tag)
+    return [
+        extract_keywords_from_doc(next(tagged_docs) if tag else match_doc, match_doc)
+        for match_doc, tag in zip(match_docs, needs_tags)
+    ]
+
+def extract_keywords(text: str) -> Dict[str, FrozenSet[str]]:
     """Extract important keywords from text using spaCy with improved education detection."""
-    doc = nlp(text.lower())
+    return extract_keywords_batch([text])[0]
+
+# Keywords of recently seen job descriptions, most recently used last. Only touched
+# from the event loop, so no lock is needed.
+JOB_KEYWORDS_CACHE: "OrderedDict[str, Dict[str, FrozenSet[str]]]" = OrderedDict()
+JOB_KEYWORDS_CACHE_SIZE = 1024
+
+def job_description_key(text: str) -> str:
+    """Hash a job description so cache keys stay small however long the text is."""
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+def get_cached_job_keywords(key: str) -> Optional[Dict[str, FrozenSet[str]]]:
+    """Return the cached keywords for a job description, marking them recently used."""
+    keywords = JOB_KEYWORDS_CACHE.get(key)
+    if keywords is not None:
+        JOB_KEYWORDS_CACHE.move_to_end(key)
+    return keywords
+
+def cache_job_keywords(key: str, keywords: Dict[str, FrozenSet[str]]) -> None:
+    """Store a job description's keywords, evicting the least recently used entry."""
+    JOB_KEYWORDS_CACHE[key] = keywords
+    JOB_KEYWORDS_CACHE.move_to_end(key)
+    if len(JOB_KEYWORDS_CACHE) > JOB_KEYWORDS_CACHE_SIZE:
+        JOB_KEYWORDS_CACHE.popitem(last=False)
+
+def extract_keywords_from_doc(doc, match_doc) -> Dict[str, FrozenSet[str]]:
+    """Extract important keywords from a tagged doc and a tokenizer-only match_doc of the same text."""
     keywords = {
-        'technical_skills': [],
-        'soft_skills': [],
-        'education': [],
-        'experience': []
+        'technical_skills': set(),
+        'soft_skills': set(),
+        'education': set(),
+        'experience': set()
     }
     
     # Extract education information
-    keywords['education'] = extract_education_info(text)
-    
-    # Define soft skills patterns
-    soft_skills_keywords = [
-        'communication', 'leadership', 'teamwork', 'problem solving', 'analytical',
-        'time management', 'organization', 'adaptability', 'creativity', 'critical thinking',
-        'collaboration', 'interpersonal', 'presentation', 'decision making', 'flexibility',
-        'project management', 'team player', 'multitasking', 'attention to detail'
-    ]
-
-    # Define technical skills patterns
-    technical_skills_keywords = [
-        'programming', 'software', 'development', 'framework', 'language', 'database',
-        'python', 'java', 'javascript', 'typescript', 'react', 'node', 'angular', 'vue',
-        'html', 'css', 'sql', 'nosql', 'mongodb', 'postgresql', 'mysql', 'oracle',
-        'aws', 'azure', 'cloud', 'docker', 'kubernetes', 'devops', 'ci/cd',
-        'git', 'github', 'bitbucket', 'jira', 'agile', 'scrum', 'rest', 'api',
-        'microservices', 'web services', 'testing', 'debugging', 'algorithms',
-        'data structures', 'oop', 'object oriented', 'functional programming',
-        'mobile', 'android', 'ios', 'swift', 'kotlin', 'flutter', 'react native'
-    ]
+    keywords['education'].update(extract_education_info(match_doc))
     
     # Extract technical skills and experience
     for token in doc:
-        if token.pos_ in ['NOUN', 'PROPN'] and len(token.text) > 2:
-            word = token.text.lower()
+        if token.pos in (NOUN, PROPN) and len(token.text) > 2:
+            word = token.lower_
             
             # Check for technical skills
-            if any(tech.lower() in word for tech in technical_skills_keywords):
-                keywords['technical_skills'].append(word)
+            if TECHNICAL_SKILLS_RE.search(word):
+                keywords['technical_skills'].add(word)
             
             # Check for experience keywords
-            if any(exp in word for exp in ['experience', 'work', 'project', 'year']):
-                keywords['experience'].append(word)
+            if EXPERIENCE_RE.search(word):
+                keywords['experience'].add(word)
     
-    # Check for soft skills
-    for sent in doc.sents:
-        sent_text = sent.text.lower()
-        for skill in soft_skills_keywords:
-            if skill in sent_text:
-                keywords['soft_skills'].append(skill)
+    # Check for soft skills as substrings, so inflected forms ("communications") still count
+    keywords['soft_skills'].update(skill for skill in SOFT_SKILLS_KEYWORDS if skill in match_doc.text)
     
-    # Clean up and remove duplicates
-    for category in keywords:
-        keywords[category] = list(set(keywords[category]))
-        keywords[category] = [k.strip() for k in keywords[category] if len(k.strip()) > 2]
-        # Ensure each category has at least an empty list
-        if not keywords[category]:
-            keywords[category] = []
-    
-    return keywords
+    # Tokens never carry whitespace and every detection site already enforces the
+    # minimum length, so the sets only need freezing
+    return {category: frozenset(values) for category, values in keywords.items()}
 
-def calculate_match_scores(resume_keywords: Dict[str, List[str]], job_keywords: Dict[str, List[str]]) -> Dict[str, float]:
+def calculate_match_scores(resume_keywords: Dict[str, FrozenSet[str]], job_keywords: Dict[str, FrozenSet[str]]) -> Dict[str, float]:
     """Calculate match scores for different categories."""
-    scores = {}
-    
-    for category in resume_keywords:
-        resume_set = set(resume_keywords.get(category, []))
-        job_set = set(job_keywords.get(category, []))
-        
-        if job_set:
-            match_score = len(resume_set.intersection(job_set)) / len(job_set) * 100
-        else:
-            match_score = 100  # If no requirements in job description, assume full match
-            
-        scores[category] = round(match_score, 2)
+    # If the job description has no requirements in a category, assume full match
+    scores = {
+        category: round(len(resume_set & job_keywords[category]) / len(job_keywords[category]) * 100, 2)
+        if job_keywords[category] else 100
+        for category, resume_set in resume_keywords.items()
+    }
     
-    # Calculate overall match (excluding empty categories)
-    valid_scores = [score for score in scores.values() if score is not None]
-    scores['overall_match'] = round(sum(valid_scores) / len(valid_scores), 2) if valid_scores else 0
+    # Calculate overall match as the mean of the category scores
+    scores['overall_match'] = round(sum(scores.values()) / len(scores), 2)
     
     return scores
 
+def normalization_key(term: str) -> str:
+    """Fold an education term to a lowercase key without dots or spaces."""
+    return term.lower().replace('.', '').replace(' ', '')
+
+# Normalized variation -> standard form. Degrees are inserted last so they win
+# where a short form is also a field (e.g. "me").
+NORMALIZE_MAP = {
+    normalization_key(variation): label
+    for group in ('fields', 'degrees')
+    for label, variations in EDUCATION_PATTERNS[group].items()
+    for variation in variations
+}
+
 def normalize_education_term(term: str) -> str:
     """Normalize education terms to standard forms."""
     term = term.lower().strip()
-    
-    # Check degree mappings
-    for degree_type, variations in EDUCATION_PATTERNS['degrees'].items():
-        if any(var in term for var in variations):
-            return degree_type
-            
-    # Check field mappings
-    for field_type, variations in EDUCATION_PATTERNS['fields'].items():
-        if any(var in term for var in variations):
-            return field_type
-            
-    return term
+    return NORMALIZE_MAP.get(normalization_key(term), term)
 
-def generate_improvements(resume_keywords: Dict[str, List[str]], job_keywords: Dict[str, List[str]]) -> Dict[str, List[str]]:
+def generate_improvements(resume_keywords: Dict[str, FrozenSet[str]], job_keywords: Dict[str, FrozenSet[str]]) -> Dict[str, List[str]]:
     """Generate detailed improvement suggestions."""
     improvements = {
         'missing_keywords': [],
@@ -363,19 +406,17 @@ def generate_improvements(resume_keywords: Dict[str, List[str]], job_keywords: D
     
     # Find missing keywords in each category
     for category in resume_keywords:
-        resume_set = set(resume_keywords[category])
-        job_set = set(job_keywords[category])
-        missing = job_set - resume_set
+        missing = sorted(job_keywords[category] - resume_keywords[category])
         
         if missing:
-            improvements['missing_keywords'].extend(list(missing))
+            improvements['missing_keywords'].extend(missing)
             
             # Generate category-specific improvements
             if category == 'technical_skills':
-                improvements['skills_needed'].extend(list(missing))
-                improvements['improvements'].append(f"Add experience with {', '.join(list(missing))} to your technical skills section")
+                improvements['skills_needed'].extend(missing)
+                improvements['improvements'].append(f"Add experience with {', '.join(missing)} to your technical skills section")
             elif category == 'soft_skills':
-                improvements['improvements'].append(f"Highlight your {', '.join(list(missing))} abilities in your experience descriptions")
+                improvements['improvements'].append(f"Highlight your {', '.join(missing)} abilities in your experience descriptions")
             elif category == 'education':
                 improvements['improvements'].append("Consider adding relevant certifications or educational achievements")
             elif category == 'experience':
@@ -417,21 +458,26 @@ async def analyze_resume(resume_file: UploadFile = File(...), job_description: s
             logger.error("Empty job description")
             raise HTTPException(status_code=400, detail="Job description cannot be empty")
         
-        content = await resume_file.read()
-        if not content:
+        if not resume_file.size:
             logger.error("Empty resume file")
             raise HTTPException(status_code=400, detail="Resume file is empty")
         
+        if resume_file.size > MAX_UPLOAD_SIZE:
+            logger.error(f"Resume file too large: {resume_file.size} bytes")
+            raise HTTPException(status_code=413, detail=f"Resume file is too large. The maximum size is {MAX_UPLOAD_SIZE // (1024 * 1024)} MB.")
+        
+        # Hand the parsers the spooled upload itself rather than a bytes copy of it
+        resume_stream = resume_file.file
+        resume_stream.seek(0)
+        
         # Extract text based on file type
-        resume_text = ""
+        extract_text = TEXT_EXTRACTORS.get(os.path.splitext(resume_file.filename)[1].lower())
+        if extract_text is None:
+            logger.error(f"Unsupported file format: {resume_file.filename}")
+            raise HTTPException(status_code=400, detail="Unsupported file format. Please upload a PDF or DOCX file.")
+        
         try:
-            if resume_file.filename.lower().endswith('.pdf'):
-                resume_text = extract_text_from_pdf(content)
-            elif resume_file.filename.lower().endswith('.docx'):
-                resume_text = extract_text_from_docx(content)
-            else:
-                logger.error(f"Unsupported file format: {resume_file.filename}")
-                raise HTTPException(status_code=400, detail="Unsupported file format. Please upload a PDF or DOCX file.")
+            resume_text = await asyncio.to_thread(extract_text, resume_stream)
         except Exception as e:
             logger.error(f"Error extracting text from file: {str(e)}")
             raise HTTPException(status_code=400, detail=f"Could not read the file: {str(e)}")
@@ -444,8 +490,16 @@ async def analyze_resume(resume_file: UploadFile = File(...), job_description: s
             
         # Extract keywords from both resume and job description
         try:
-            resume_keywords = extract_keywords(resume_text)
-            job_keywords = extract_keywords(job_description)
+            # spaCy is CPU-bound; run it off the event loop so other requests keep being served
+            job_key = job_description_key(job_description)
+            job_keywords = get_cached_job_keywords(job_key)
+            if job_keywords is None:
+                resume_keywords, job_keywords = await asyncio.to_thread(
+                    extract_keywords_batch, [resume_text, job_description]
+                )
+                cache_job_keywords(job_key, job_keywords)
+            else:
+                resume_keywords = await asyncio.to_thread(extract_keywords, resume_text)
             logger.debug(f"Extracted keywords - Resume: {resume_keywords}, Job: {job_keywords}")
         except Exception as e:
             logger.error(f"Error extracting keywords: {str(e)}")
@@ -475,7 +529,7 @@ async def analyze_resume(resume_file: UploadFile = File(...), job_description: s
                 'softSkills': scores['soft_skills'],
                 'education': scores['education'],
                 'experience': scores['experience'],
-                'matchedKeywords': [kw for cat in resume_keywords.values() for kw in cat],
+                'matchedKeywords': [kw for cat in resume_keywords.values() for kw in sorted(cat)],
                 'missingKeywords': improvements['missing_keywords'],
                 'improvements': improvements['improvements'],
                 'skillsNeeded': improvements['skills_needed']
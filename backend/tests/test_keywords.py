@@ -0,0 +1,22 @@
+from app.main import extract_keywords, nlp
+
+
+def test_soft_skills_match_inflected_forms():
+    keywords = extract_keywords(
+        "Strong communications and presentations skills. Worked with cross-functional organizations."
+    )
+
+    assert keywords['soft_skills'] == {'communication', 'organization', 'presentation'}
+
+
+def test_dotted_degree_keeps_its_field():
+    assert extract_keywords("M.Sc. in Data Science")['education'] == {'master in technology'}
+    assert extract_keywords("B.E. Computer Engineering")['education'] == {'bachelor in technology'}
+
+
+def test_over_cap_text_that_lengthens_when_lowercased():
+    text = "İstanbul " + "python developer " * (nlp.max_length // 17 + 1)
+
+    keywords = extract_keywords(text)
+
+    assert 'python' in keywords['technical_skills']
@@ -0,0 +1,45 @@
+import io
+import zipfile
+
+from app.main import extract_text_from_docx
+
+DOCUMENT_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
+  <w:body>
+    <w:p>
+      <w:pPr><w:tabs><w:tab w:val="left" w:pos="2880"/></w:tabs></w:pPr>
+      <w:r><w:t>Skills:</w:t></w:r>
+      <w:r><w:tab/></w:r>
+      <w:r><w:t>Python</w:t></w:r>
+      <w:r><w:tab/><w:t>Docker</w:t></w:r>
+    </w:p>
+    <w:p>
+      <w:r><w:t>Experience</w:t><w:br/><w:t>Software Engineer at Acme</w:t></w:r>
+      <w:r><w:cr/><w:t>Kubernetes, AWS</w:t></w:r>
+    </w:p>
+    <w:p/>
+    <w:p>
+      <w:r><w:rPr><w:b/></w:rPr><w:t>B.Tech</w:t></w:r>
+      <w:r><w:t xml:space="preserve"> in Computer Science</w:t></w:r>
+    </w:p>
+  </w:body>
+</w:document>
+"""
+
+
+def build_docx() -> io.BytesIO:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("word/document.xml", DOCUMENT_XML)
+    buffer.seek(0)
+    return buffer
+
+
+def test_docx_tabs_and_breaks_become_whitespace():
+    text = extract_text_from_docx(build_docx())
+
+    assert text == (
+        "Skills:\tPython\tDocker "
+        "Experience\nSoftware Engineer at Acme\nKubernetes, AWS "
+        "B.Tech in Computer Science"
+    )